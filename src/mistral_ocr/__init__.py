@@ -1,16 +1,29 @@
 """Mistral OCR - OCR project leveraging Mistral AI capabilities."""
 
 import sys
+from typing import Any
+
+from ._version import __version__ as __version__
 
-__version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .core import OCRProcessor
-
 __all__ = ["OCRProcessor"]
 
 
+def __getattr__(name: str) -> Any:
+    """Lazily resolve heavy attributes (PEP 562).
+
+    Importing ``OCRProcessor`` pulls in the Mistral SDK, so defer it until
+    first access to keep ``import mistral_ocr`` (and the CLI startup) fast.
+    """
+    if name == "OCRProcessor":
+        from .core import OCRProcessor
+
+        return OCRProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main() -> None:
     """Main entry point placeholder."""
     from .__main__ import main as cli_main
@@ -1,13 +1,17 @@
 """Command-line interface for Mistral OCR."""
 
+from __future__ import annotations
+
 import argparse
 import logging
 import sys
-import traceback
 from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from ._version import __version__
 
-from . import __version__
-from .core import OCRProcessor
+if TYPE_CHECKING:
+    from .core import OCRProcessor
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -47,7 +51,7 @@ Examples:
         "--output",
         "-o",
         type=str,
-        help="Output file path (default: stdout)",
+        help="Output file path, or directory with multiple PDFs (default: stdout)",
     )
 
     parser.add_argument(
@@ -63,17 +67,176 @@ Examples:
         help="Include images as base64 in markdown (default: True)",
     )
 
+    parser.add_argument(
+        "--upload",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Send PDFs via the files API instead of inline base64 (default: auto by size)",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Split the PDF into page ranges, OCR them concurrently and emit "
+        "markdown as pages complete (requires pypdf)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=8,
+        help="Maximum concurrent OCR requests when processing multiple PDFs (default: 8)",
+    )
+
     parser.add_argument(
         "pdf_file",
-        nargs="?",
-        help="Input PDF file for OCR processing",
+        nargs="*",
+        help="Input PDF file(s) for OCR processing",
     )
 
     return parser
 
 
+# Characters encoded and written per chunk when saving markdown output.
+_WRITE_CHUNK_CHARS = 1024 * 1024
+
+
+def _write_markdown(output_path: Path, markdown_content: str) -> None:
+    """Write markdown to a file in encoded chunks.
+
+    Path.write_text encodes the whole document into a second full-size
+    buffer first; with embedded base64 images that can double peak memory,
+    so encode and write a chunk at a time instead.
+    """
+    with output_path.open("wb", buffering=_WRITE_CHUNK_CHARS) as f:
+        for start in range(0, len(markdown_content), _WRITE_CHUNK_CHARS):
+            chunk = markdown_content[start : start + _WRITE_CHUNK_CHARS]
+            f.write(chunk.encode("utf-8"))
+
+
+def _run_streaming(
+    processor: OCRProcessor,
+    pdf_paths: list[Path],
+    parsed_args: argparse.Namespace,
+    logger: logging.Logger,
+) -> None:
+    """OCR PDFs via the page-split path, emitting markdown as it arrives.
+
+    Multiple PDFs are streamed one after another: to per-file <stem>.md
+    outputs when --output names a directory, or to stdout separated by
+    double newlines.
+    """
+    import asyncio
+
+    def _stream_to(pdf_path: Path, sink: IO[bytes]) -> None:
+        logger.info(f"Processing PDF (streaming): {pdf_path}")
+        asyncio.run(
+            processor.process_pdf_streaming(
+                pdf_path,
+                sink,
+                include_images=parsed_args.include_images,
+                concurrency=parsed_args.jobs,
+            )
+        )
+
+    if parsed_args.output and len(pdf_paths) > 1:
+        # As in batch mode, --output names a directory with multiple inputs.
+        output_dir = Path(parsed_args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for pdf_path in pdf_paths:
+            output_path = output_dir / f"{pdf_path.stem}.md"
+            with output_path.open("wb") as sink:
+                _stream_to(pdf_path, sink)
+            logger.info(f"Markdown saved to: {output_path}")
+    elif parsed_args.output:
+        output_path = Path(parsed_args.output)
+        with output_path.open("wb") as sink:
+            _stream_to(pdf_paths[0], sink)
+        logger.info(f"Markdown saved to: {output_path}")
+    else:
+        for index, pdf_path in enumerate(pdf_paths):
+            if index:
+                sys.stdout.buffer.write(b"\n\n")
+            _stream_to(pdf_path, sys.stdout.buffer)
+
+
+def _run_single(
+    processor: OCRProcessor,
+    pdf_path: Path,
+    parsed_args: argparse.Namespace,
+    logger: logging.Logger,
+) -> None:
+    """OCR one PDF in a single request and write the markdown output."""
+    logger.info(f"Processing PDF: {pdf_path}")
+
+    # Per-page byte fragments keep embedded image base64 out of the
+    # str layer and scatter-write via writelines, so the document
+    # is never materialized as one contiguous buffer.
+    fragments = processor.iter_pdf_markdown(
+        pdf_path,
+        include_images=parsed_args.include_images,
+        upload=parsed_args.upload,
+    )
+
+    # Output results
+    if parsed_args.output:
+        output_path = Path(parsed_args.output)
+        with output_path.open("wb") as f:
+            f.writelines(fragments)
+        logger.info(f"Markdown saved to: {output_path}")
+    else:
+        sys.stdout.buffer.writelines(fragments)
+        sys.stdout.flush()
+
+
+def _run_batch(
+    processor: OCRProcessor,
+    pdf_paths: list[Path],
+    parsed_args: argparse.Namespace,
+    logger: logging.Logger,
+) -> None:
+    """OCR several PDFs concurrently and write each result."""
+    import asyncio
+
+    logger.info(f"Processing {len(pdf_paths)} PDFs (jobs={parsed_args.jobs})")
+
+    markdown_contents = asyncio.run(
+        processor.process_pdfs(
+            pdf_paths,
+            include_images=parsed_args.include_images,
+            concurrency=parsed_args.jobs,
+            upload=parsed_args.upload,
+        )
+    )
+
+    if parsed_args.output:
+        # With multiple inputs, --output names a directory holding
+        # one <input stem>.md per PDF.
+        output_dir = Path(parsed_args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for pdf_path, markdown_content in zip(
+            pdf_paths, markdown_contents, strict=True
+        ):
+            output_path = output_dir / f"{pdf_path.stem}.md"
+            _write_markdown(output_path, markdown_content)
+            logger.info(f"Markdown saved to: {output_path}")
+    else:
+        for markdown_content in markdown_contents:
+            sys.stdout.write(markdown_content)
+            sys.stdout.write("\n\n")
+
+
 def main(args: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
+    if args is None:
+        args = sys.argv[1:]
+
+    # Fast path: answer --version before any parser or logging setup.
+    if args and args[0] == "--version":
+        sys.stdout.write(f"mistral-ocr {__version__}\n")
+        return 0
+
     parser = create_parser()
     parsed_args = parser.parse_args(args)
 
@@ -95,35 +258,42 @@ def main(args: list[str] | None = None) -> int:
         parser.print_help()
         return 1
 
-    pdf_path = Path(parsed_args.pdf_file)
-    if not pdf_path.exists():
-        logger.error(f"PDF file not found: {pdf_path}")
-        return 1
+    # The SDK is definitely needed now, so start importing it in the
+    # background while the input paths are validated below; by the time
+    # OCRProcessor is constructed the module is usually already in
+    # sys.modules and the import below is a no-op.
+    import importlib
+    import threading
 
-    if pdf_path.suffix.lower() != ".pdf":
-        logger.error(f"Input file must be a PDF: {pdf_path}")
-        return 1
+    threading.Thread(
+        target=importlib.import_module, args=("mistralai",), daemon=True
+    ).start()
+
+    pdf_paths = [Path(p) for p in parsed_args.pdf_file]
+    for pdf_path in pdf_paths:
+        if not pdf_path.exists():
+            logger.error(f"PDF file not found: {pdf_path}")
+            return 1
+
+        if pdf_path.suffix.lower() != ".pdf":
+            logger.error(f"Input file must be a PDF: {pdf_path}")
+            return 1
 
     try:
-        # Initialize OCR processor
+        # Initialize OCR processor. Imported here so that --help/--version
+        # and argument errors never pay the Mistral SDK import cost.
         logger.info("Initializing OCR processor...")
 
-        processor = OCRProcessor(api_key=parsed_args.api_key)
+        from .core import OCRProcessor
 
-        # Process PDF
-        logger.info(f"Processing PDF: {pdf_path}")
-
-        markdown_content = processor.process_pdf(
-            pdf_path, include_images=parsed_args.include_images
-        )
+        processor = OCRProcessor(api_key=parsed_args.api_key)
 
-        # Output results
-        if parsed_args.output:
-            output_path = Path(parsed_args.output)
-            output_path.write_text(markdown_content, encoding="utf-8")
-            logger.info(f"Markdown saved to: {output_path}")
+        if parsed_args.stream:
+            _run_streaming(processor, pdf_paths, parsed_args, logger)
+        elif len(pdf_paths) == 1:
+            _run_single(processor, pdf_paths[0], parsed_args, logger)
         else:
-            sys.stdout.write(markdown_content)
+            _run_batch(processor, pdf_paths, parsed_args, logger)
 
         logger.info("Processing completed successfully")
 
@@ -132,6 +302,8 @@ def main(args: list[str] | None = None) -> int:
     except Exception as e:
         logger.error(f"Error: {e}")
         if parsed_args.debug:
+            import traceback
+
             traceback.print_exc(file=sys.stderr)
         return 1
 
@@ -0,0 +1,3 @@
+"""Package version, kept in a leaf module so the CLI can read it cheaply."""
+
+__version__ = "0.1.0"
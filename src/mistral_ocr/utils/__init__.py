@@ -1,11 +1,21 @@
 """Utility functions for OCR processing."""
 
-from .encoding import create_data_url, encode_pdf_to_base64
-from .markdown import combine_ocr_pages_to_markdown, replace_images_in_markdown
+from .encoding import create_data_url, encode_pdf_to_data_url, iter_pdf_b64
+from .markdown import (
+    combine_ocr_pages_to_markdown,
+    combine_ocr_pages_to_markdown_bytes,
+    iter_markdown,
+    iter_markdown_bytes,
+    replace_images_in_markdown,
+)
 
 __all__ = [
     "combine_ocr_pages_to_markdown",
+    "combine_ocr_pages_to_markdown_bytes",
     "create_data_url",
-    "encode_pdf_to_base64",
+    "encode_pdf_to_data_url",
+    "iter_markdown",
+    "iter_markdown_bytes",
+    "iter_pdf_b64",
     "replace_images_in_markdown",
 ]
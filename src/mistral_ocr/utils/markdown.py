@@ -1,6 +1,16 @@
 """Markdown processing utilities."""
 
-from mistralai.models import OCRResponse
+import re
+from collections.abc import Iterator
+
+from mistralai.models import OCRPageObject, OCRResponse
+
+
+def _page_images(page: OCRPageObject) -> dict[str, str | None]:
+    """Extract the image-id to base64 mapping for a page."""
+    # image_base64 is a fixed field on the pydantic model, so access it
+    # directly; "or None" still normalizes empty strings from the response.
+    return {img.id: img.image_base64 or None for img in page.images}
 
 
 def replace_images_in_markdown(
@@ -8,6 +18,9 @@ def replace_images_in_markdown(
 ) -> str:
     """Replace image placeholders in markdown with base64-encoded images.
 
+    All references are rewritten in a single pass over the markdown rather
+    than one full scan (and string copy) per image.
+
     Args:
         markdown_str: Markdown text containing image placeholders.
         images_dict: Dictionary mapping image IDs to base64 strings.
@@ -15,15 +28,42 @@ def replace_images_in_markdown(
     Returns:
         Markdown text with images replaced by base64 data URLs.
     """
-    for img_name, base64_str in images_dict.items():
-        if base64_str is not None:
-            # Create data URL for the image
-            data_url = f"data:image/jpeg;base64,{base64_str}"
-            # Replace markdown image references
-            markdown_str = markdown_str.replace(
-                f"![{img_name}]({img_name})", f"![{img_name}]({data_url})"
-            )
-    return markdown_str
+    names = [name for name, base64_str in images_dict.items() if base64_str]
+    if not names:
+        return markdown_str
+
+    # Match ![name](name) for any known image name; \1 keeps the reference
+    # forms consistent so only exact placeholders are rewritten. Compiled
+    # explicitly: per-page patterns are unique, so re's internal cache
+    # would churn instead of hitting.
+    pattern = re.compile(
+        r"!\[(" + "|".join(re.escape(name) for name in names) + r")\]\(\1\)"
+    )
+
+    def _embed(match: re.Match[str]) -> str:
+        name = match.group(1)
+        return f"![{name}](data:image/jpeg;base64,{images_dict[name]})"
+
+    return pattern.sub(_embed, markdown_str)
+
+
+def iter_markdown(ocr_response: OCRResponse) -> Iterator[str]:
+    """Yield markdown fragments for an OCR response, one page at a time.
+
+    Pages are separated by double newlines. Streaming consumers (e.g. the
+    CLI writing to a file) can emit each fragment as it is produced instead
+    of buffering the whole document.
+
+    Args:
+        ocr_response: Response from OCR processing containing text and images.
+
+    Yields:
+        Markdown fragments that concatenate to the combined document.
+    """
+    for page_index, page in enumerate(ocr_response.pages):
+        if page_index:
+            yield "\n\n"
+        yield replace_images_in_markdown(page.markdown, _page_images(page))
 
 
 def combine_ocr_pages_to_markdown(ocr_response: OCRResponse) -> str:
@@ -35,22 +75,74 @@ def combine_ocr_pages_to_markdown(ocr_response: OCRResponse) -> str:
     Returns:
         Combined markdown string with embedded images.
     """
-    markdowns = []
-
-    for page in ocr_response.pages:
-        # Extract images from page
-        image_data: dict[str, str | None] = {}
-        for img in page.images:
-            # Handle potential None values from the OCR response
-            image_data[img.id] = (
-                img.image_base64
-                if hasattr(img, "image_base64") and img.image_base64
-                else None
-            )
-
-        # Replace image placeholders with actual base64 data
-        page_markdown = replace_images_in_markdown(page.markdown, image_data)
-        markdowns.append(page_markdown)
-
-    # Join all pages with double newlines
-    return "\n\n".join(markdowns)
+    return "".join(iter_markdown(ocr_response))
+
+
+def _replace_images_in_markdown_bytes(
+    markdown_bytes: bytes, images_dict: dict[str, str | None]
+) -> bytes:
+    """Bytes-level counterpart of :func:`replace_images_in_markdown`.
+
+    Base64 payloads enter the document via a fast ASCII encode instead of
+    being interpolated into a str and UTF-8 encoded again on output.
+    """
+    names = [name for name, base64_str in images_dict.items() if base64_str]
+    if not names:
+        return markdown_bytes
+
+    pattern = re.compile(
+        rb"!\[("
+        + b"|".join(re.escape(name.encode("utf-8")) for name in names)
+        + rb")\]\(\1\)"
+    )
+
+    def _embed(match: re.Match[bytes]) -> bytes:
+        name = match.group(1)
+        base64_str = images_dict[name.decode("utf-8")]
+        assert base64_str is not None  # names only holds populated images
+        return (
+            b"!["
+            + name
+            + b"](data:image/jpeg;base64,"
+            + base64_str.encode("ascii")
+            + b")"
+        )
+
+    return pattern.sub(_embed, markdown_bytes)
+
+
+def iter_markdown_bytes(ocr_response: OCRResponse) -> Iterator[bytes]:
+    """Yield UTF-8 markdown fragments for an OCR response, one page at a time.
+
+    Bytes counterpart of :func:`iter_markdown`: fragments can be handed to
+    ``writelines`` so the document never has to exist as one contiguous
+    buffer.
+
+    Args:
+        ocr_response: Response from OCR processing containing text and images.
+
+    Yields:
+        UTF-8 fragments that concatenate to the combined document.
+    """
+    for page_index, page in enumerate(ocr_response.pages):
+        if page_index:
+            yield b"\n\n"
+        yield _replace_images_in_markdown_bytes(
+            page.markdown.encode("utf-8"), _page_images(page)
+        )
+
+
+def combine_ocr_pages_to_markdown_bytes(ocr_response: OCRResponse) -> bytes:
+    """Combine OCR pages into a single UTF-8 encoded markdown document.
+
+    Page text is encoded once and image base64 stays out of the str layer
+    entirely, so the document never exists as one large Python str — useful
+    when the result is written straight to a file or stdout.
+
+    Args:
+        ocr_response: Response from OCR processing containing text and images.
+
+    Returns:
+        Combined markdown document as UTF-8 bytes.
+    """
+    return b"".join(iter_markdown_bytes(ocr_response))